@@ -6,11 +6,24 @@ Run locally: streamlit run dashboard/app.py
 Deploy free: https://streamlit.io/cloud
 """
 import streamlit as st
+import bisect
 import json
+import pandas as pd
+import re
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
 from datetime import datetime
 import os
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Paper sources known to the pipeline
+ALL_SOURCES = ("arxiv", "openalex", "nber")
+
 # Page config
 st.set_page_config(
     page_title="Leopold's Research Digest",
@@ -18,8 +31,8 @@ st.set_page_config(
     layout="wide"
 )
 
-# Custom CSS
-st.markdown("""
+# Custom CSS (module-level constant; injected once per session below)
+CSS = """
 <style>
     .paper-card {
         border-left: 4px solid #2563eb;
@@ -50,37 +63,144 @@ st.markdown("""
         font-weight: 600;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+# Note: this must run on every rerun - Streamlit drops elements that are
+# not re-emitted, so gating the injection on session state would lose the
+# styles after the first interaction. The win is the constant itself:
+# the string is built once at import instead of re-interpolated per rerun.
+st.markdown(CSS, unsafe_allow_html=True)
 
 
-def load_digests():
-    """Load all digest files, sorted by generation time (newest first)"""
+def digest_file_index():
+    """Build a hashable index of (path, mtime) for all digest files.
+
+    Uses os.scandir, which yields stat info from the directory read
+    itself instead of one stat() syscall per file like glob + stat.
+    The index is the cache key for the per-file loaders, so only new
+    or changed files are re-read on a rerun.
+    """
     data_dir = Path(__file__).parent.parent / "data"
-    
-    digests = []
-    if data_dir.exists():
-        for file in data_dir.glob("*.json"):
-            try:
-                with open(file) as f:
-                    data = json.load(f)
-                    data['filename'] = file.name
-                    digests.append(data)
-            except:
-                continue
-    
-    # Sort by generated_at timestamp (newest first)
-    def get_timestamp(d):
+
+    if not data_dir.exists():
+        return ()
+
+    entries = []
+    with os.scandir(data_dir) as it:
+        for entry in it:
+            # Only pipeline digests ({period}_digest_{date}.json): data/
+            # also holds JSON cache sidecars (validator, summaries,
+            # OpenAlex source IDs) that are not digests
+            if ('_digest_' in entry.name and entry.name.endswith('.json')
+                    and entry.is_file()):
+                entries.append((entry.path, entry.stat().st_mtime_ns))
+
+    entries.sort()
+    return tuple(entries)
+
+
+def _parse_json_file(path: str) -> dict:
+    """Parse a JSON file, preferring orjson's faster C parser when available"""
+    raw = Path(path).read_bytes()
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+
+# Digest files are written with the metadata keys before the papers array,
+# so a small head read is enough to get them without parsing every paper.
+_META_KEYS = ('generated_at', 'period', 'paper_count')
+_META_RE = re.compile(r'"(generated_at|period|paper_count)":\s*(?:"([^"]*)"|(\d+))')
+
+
+@st.cache_data(show_spinner=False)
+def read_digest_meta(path: str, mtime_ns: int):
+    """Read just the top-level metadata of a digest file (no papers parse)"""
+    meta = {'filename': Path(path).name, 'path': path, 'mtime_ns': mtime_ns}
+
+    try:
+        with open(path, 'rb') as f:
+            head = f.read(4096).decode('utf-8', errors='ignore')
+        for key, str_val, int_val in _META_RE.findall(head):
+            meta[key] = int(int_val) if int_val else str_val
+        if 'generated_at' not in meta:
+            raise ValueError("metadata not in file head")
+    except Exception:
+        # Fall back to a full parse for files with unexpected layout
         try:
-            ts = d.get('generated_at', '')
-            return datetime.fromisoformat(ts.replace('Z', '+00:00'))
+            data = _parse_json_file(path)
+            for key in _META_KEYS:
+                if key in data:
+                    meta[key] = data[key]
         except:
-            return datetime.min
-    
-    digests.sort(key=get_timestamp, reverse=True)
-    
-    return digests
+            return None
+
+    return meta
+
+
+def list_digest_meta(file_index: tuple):
+    """Cheap metadata pass over all digests, sorted newest first"""
+    metas = [read_digest_meta(path, mtime_ns) for path, mtime_ns in file_index]
+    metas = [m for m in metas if m]
+
+    # ISO timestamps sort correctly as strings
+    metas.sort(key=lambda m: m.get('generated_at', ''), reverse=True)
+
+    return metas
+
+
+@st.cache_data(show_spinner=False)
+def total_paper_count(file_index: tuple) -> int:
+    """Sum paper counts across all digests (cached on the file index)"""
+    return sum(
+        (read_digest_meta(path, mtime_ns) or {}).get('paper_count', 0)
+        for path, mtime_ns in file_index
+    )
+
+
+@st.cache_data(show_spinner=False)
+def load_digest(path: str, mtime_ns: int) -> dict:
+    """Fully parse a single digest file (cached per file + mtime)"""
+    data = _parse_json_file(path)
+    data['filename'] = Path(path).name
+    return data
+
+
+@st.cache_data(show_spinner=False)
+def filter_papers(path: str, mtime_ns: int, min_score: float, sources: frozenset):
+    """Filter a digest's papers (cached per file + filter settings)"""
+    papers = load_digest(path, mtime_ns).get('papers', [])
+    return [
+        p for p in papers
+        if p.get('relevance_score', 0) >= min_score
+        and p.get('source', '') in sources
+    ]
 
 
+@st.cache_data(show_spinner=False)
+def digest_table(path: str, mtime_ns: int) -> pd.DataFrame:
+    """Build the Browse All table for one digest (cached per file + mtime)"""
+    papers = load_digest(path, mtime_ns).get('papers', [])
+    if not papers:
+        return pd.DataFrame(columns=['Title', 'Source', 'Score', 'Date', 'URL'])
+
+    df = pd.DataFrame(papers)
+
+    # Prefer the truncated title written by _save_digest; only older
+    # digests without the field pay for vectorized truncation here
+    if 'title_short' in df.columns:
+        df['title'] = df['title_short'].fillna(df['title'])
+    else:
+        titles = df['title'].fillna('')
+        df['title'] = titles.where(titles.str.len() <= 80, titles.str.slice(0, 80) + '...')
+
+    df = df.reindex(
+        columns=['title', 'source', 'relevance_score', 'published_date', 'url']
+    )
+    df.columns = ['Title', 'Source', 'Score', 'Date', 'URL']
+
+    return df
+
+
+@lru_cache(maxsize=512)
 def format_timestamp(iso_timestamp):
     """Format ISO timestamp to readable format"""
     try:
@@ -90,6 +210,7 @@ def format_timestamp(iso_timestamp):
         return iso_timestamp
 
 
+@lru_cache(maxsize=512)
 def format_timestamp_short(iso_timestamp):
     """Format ISO timestamp to short format"""
     try:
@@ -99,27 +220,33 @@ def format_timestamp_short(iso_timestamp):
         return iso_timestamp
 
 
+# Score tiers: < 25 low, 25-49 medium, >= 50 high
+_SCORE_TEMPLATES = (
+    '<span class="score-low">{}</span>',
+    '<span class="score-medium">📌 {}</span>',
+    '<span class="score-high">🔥 {}</span>',
+)
+_SCORE_CUTS = (25, 50)
+
+
+@lru_cache(maxsize=128)
 def format_score(score):
     """Format relevance score with color"""
-    if score >= 50:
-        return f'<span class="score-high">🔥 {score:.0f}</span>'
-    elif score >= 25:
-        return f'<span class="score-medium">📌 {score:.0f}</span>'
-    else:
-        return f'<span class="score-low">{score:.0f}</span>'
+    tier = bisect.bisect_right(_SCORE_CUTS, score)
+    return _SCORE_TEMPLATES[tier].format(f"{score:.0f}")
 
 
 def main():
     st.title("📚 Leopold's Research Digest")
     st.markdown("*Personalized academic paper recommendations*")
     
-    # Load digests once
-    digests = load_digests()
-    
+    # Cheap metadata pass; full digests are parsed lazily per tab
+    file_index = digest_file_index()
+    digest_meta = list_digest_meta(file_index)
+
     # Show last update time prominently at the top
-    if digests:
-        latest = digests[0]
-        generated_at = latest.get('generated_at', 'Unknown')
+    if digest_meta:
+        generated_at = digest_meta[0].get('generated_at', 'Unknown')
         st.markdown(f"""
         <div class="timestamp-box">
             🕐 <span class="last-updated">Last Updated:</span> {format_timestamp(generated_at)}
@@ -135,27 +262,32 @@ def main():
         
         sources = st.multiselect(
             "Sources",
-            ["arxiv", "openalex", "nber"],
-            default=["arxiv", "openalex", "nber"]
+            list(ALL_SOURCES),
+            default=list(ALL_SOURCES)
         )
+        sources_set = frozenset(sources)
         
         st.divider()
         
-        # Quick stats
-        if digests:
-            total_papers = sum(d.get('paper_count', 0) for d in digests)
-            st.metric("Total Papers Collected", total_papers)
-            st.metric("Digests Available", len(digests))
-            
+        # Quick stats (metadata only, no paper arrays loaded)
+        if digest_meta:
+            st.metric("Total Papers Collected", total_paper_count(file_index))
+            st.metric("Digests Available", len(digest_meta))
+
             st.divider()
-            
-            # Show all digest timestamps
+
+            # Show all digest timestamps; one st.markdown call instead of
+            # one render round-trip per history line. Blank-line joins:
+            # a single "\n" is a markdown soft break, which renders as a
+            # space and runs the entries together
             st.subheader("📅 Digest History")
-            for d in digests[:10]:  # Show last 10
-                timestamp = format_timestamp_short(d.get('generated_at', 'Unknown'))
-                period = d.get('period', 'daily').capitalize()
-                count = d.get('paper_count', 0)
-                st.markdown(f"• **{timestamp}** - {period} ({count} papers)")
+            lines = [
+                f"• **{format_timestamp_short(d.get('generated_at', 'Unknown'))}**"
+                f" - {d.get('period', 'daily').capitalize()}"
+                f" ({d.get('paper_count', 0)} papers)"
+                for d in islice(digest_meta, 10)  # Show last 10
+            ]
+            st.markdown("\n\n".join(lines))
     
     # Main content
     tab1, tab2, tab3 = st.tabs(["📅 Latest Digest", "📊 Browse All", "⭐ Reading List"])
@@ -163,11 +295,12 @@ def main():
     with tab1:
         st.header("Latest Digest")
         
-        if not digests:
+        if not digest_meta:
             st.info("No digests found yet. Run the digest script first!")
             st.code("python run_digest.py --daily", language="bash")
         else:
-            latest = digests[0]
+            # Only the latest digest gets fully parsed here
+            latest = load_digest(digest_meta[0]['path'], digest_meta[0]['mtime_ns'])
             
             # Show generation info
             col1, col2, col3 = st.columns(3)
@@ -180,16 +313,13 @@ def main():
             
             st.divider()
             
-            papers = latest.get('papers', [])
-            
-            # Filter papers
-            filtered_papers = [
-                p for p in papers 
-                if p.get('relevance_score', 0) >= min_score
-                and p.get('source', '') in sources
-            ]
-            
-            st.markdown(f"*Showing {len(filtered_papers)} of {len(papers)} papers*")
+            # Filtering is cached; only a changed slider/multiselect recomputes
+            filtered_papers = filter_papers(
+                digest_meta[0]['path'], digest_meta[0]['mtime_ns'],
+                min_score, sources_set
+            )
+
+            st.markdown(f"*Showing {len(filtered_papers)} of {latest.get('paper_count', 0)} papers*")
             
             for paper in filtered_papers:
                 with st.container():
@@ -198,10 +328,13 @@ def main():
                     with col1:
                         st.markdown(f"### [{paper['title']}]({paper['url']})")
                         
-                        # Metadata
-                        authors = ", ".join(paper.get('authors', [])[:3])
-                        if len(paper.get('authors', [])) > 3:
-                            authors += " et al."
+                        # Metadata (precomputed at write time; fall back
+                        # for digests written before authors_display existed)
+                        authors = paper.get('authors_display')
+                        if authors is None:
+                            authors = ", ".join(paper.get('authors', [])[:3])
+                            if len(paper.get('authors', [])) > 3:
+                                authors += " et al."
                         
                         st.markdown(f"""
                         <span class="source-badge">{paper.get('source', 'unknown').upper()}</span>
@@ -218,27 +351,35 @@ def main():
                         st.markdown(f"*{paper['summary']}*")
                     elif paper.get('abstract'):
                         with st.expander("Abstract"):
-                            st.write(paper['abstract'][:500] + "..." if len(paper.get('abstract', '')) > 500 else paper.get('abstract', ''))
+                            preview = paper.get('abstract_preview')
+                            if preview is None:
+                                abstract = paper.get('abstract', '')
+                                preview = abstract[:500] + "..." if len(abstract) > 500 else abstract
+                            st.write(preview)
                     
                     st.divider()
     
     with tab2:
         st.header("Browse All Digests")
         
-        if not digests:
+        if not digest_meta:
             st.info("No digests available yet.")
         else:
-            # Digest selector with timestamps
-            digest_options = {
-                f"{format_timestamp_short(d.get('generated_at', 'Unknown'))} - {d.get('period', 'daily')} ({d.get('paper_count', 0)} papers)": i
-                for i, d in enumerate(digests)
-            }
-            
+            # Digest selector built from metadata only; rebuilt only when
+            # the set of digest files changes, not on every interaction
+            if st.session_state.get('digest_options_key') != file_index:
+                st.session_state['digest_options'] = {
+                    f"{format_timestamp_short(m.get('generated_at', 'Unknown'))} - {m.get('period', 'daily')} ({m.get('paper_count', 0)} papers)": m
+                    for m in digest_meta
+                }
+                st.session_state['digest_options_key'] = file_index
+            digest_options = st.session_state['digest_options']
+
             selected = st.selectbox("Select digest", list(digest_options.keys()))
-            
+
             if selected:
-                idx = digest_options[selected]
-                digest = digests[idx]
+                meta = digest_options[selected]
+                digest = load_digest(meta['path'], meta['mtime_ns'])
                 
                 # Show selected digest info
                 st.markdown(f"""
@@ -247,23 +388,10 @@ def main():
                 </div>
                 """, unsafe_allow_html=True)
                 
-                papers = digest.get('papers', [])
-                
-                # Show as table
-                if papers:
-                    import pandas as pd
-                    
-                    df = pd.DataFrame([
-                        {
-                            'Title': p.get('title', '')[:80] + '...' if len(p.get('title', '')) > 80 else p.get('title', ''),
-                            'Source': p.get('source', ''),
-                            'Score': p.get('relevance_score', 0),
-                            'Date': p.get('published_date', ''),
-                            'URL': p.get('url', '')
-                        }
-                        for p in papers
-                    ])
-                    
+                # Show as table (built and cached per digest file)
+                df = digest_table(meta['path'], meta['mtime_ns'])
+
+                if not df.empty:
                     st.dataframe(
                         df,
                         column_config={
@@ -17,11 +17,26 @@ import argparse
 import json
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 from dotenv import load_dotenv
 load_dotenv()
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import xxhash
+
+    def _fingerprint(text: str) -> int:
+        return xxhash.xxh3_64_intdigest(text.encode())
+except ImportError:
+    def _fingerprint(text: str) -> int:
+        return hash(text)
+
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
@@ -103,12 +118,12 @@ class ResearchDigest:
         self._save_digest(papers, "daily")
         self._save_html(html_digest, "daily")
         
-        # Send email
-        to_email = os.getenv("DIGEST_EMAIL", "leopold.monjoie@aalto.fi")
+        # Send email (DIGEST_EMAIL may be a comma-separated list; all
+        # recipients go out in one SendGrid call)
         subject = f"📚 Research Digest - {datetime.now().strftime('%B %d, %Y')}"
-        
-        self.email_sender.send_digest(
-            to_email=to_email,
+
+        self.email_sender.send_digest_bulk(
+            to_emails=self._digest_recipients(),
             subject=subject,
             html_content=html_digest,
             plain_content=plain_digest
@@ -146,11 +161,10 @@ class ResearchDigest:
             self._save_digest(papers, "weekly")
             self._save_html(html_digest, "weekly")
             
-            to_email = os.getenv("DIGEST_EMAIL", "leopold.monjoie@aalto.fi")
             subject = f"📚 Weekly Research Digest - Week of {datetime.now().strftime('%B %d, %Y')}"
-            
-            self.email_sender.send_digest(
-                to_email=to_email,
+
+            self.email_sender.send_digest_bulk(
+                to_emails=self._digest_recipients(),
                 subject=subject,
                 html_content=html_digest,
                 plain_content=plain_digest
@@ -161,34 +175,40 @@ class ResearchDigest:
             "count": len(papers) if papers else 0
         }
     
+    @staticmethod
+    def _digest_recipients() -> list:
+        """Digest recipients from DIGEST_EMAIL (comma-separated)"""
+        raw = os.getenv("DIGEST_EMAIL", "leopold.monjoie@aalto.fi")
+        return [addr.strip() for addr in raw.split(",") if addr.strip()]
+
     def _collect_all_papers(self, days: int) -> list:
-        """Collect papers from all sources"""
+        """Collect papers from all sources (fetched concurrently)"""
         all_papers = []
-        
-        # arXiv
-        print("\n  [arXiv]")
-        try:
-            arxiv_papers = self.arxiv_collector.fetch_recent(days=days, max_results=100)
-            all_papers.extend(arxiv_papers)
-        except Exception as e:
-            print(f"  Error collecting from arXiv: {e}")
-        
-        # OpenAlex
-        print("\n  [OpenAlex]")
-        try:
-            openalex_papers = self.openalex_collector.fetch_recent(days=max(7, days), max_results=100)
-            all_papers.extend(openalex_papers)
-        except Exception as e:
-            print(f"  Error collecting from OpenAlex: {e}")
-        
-        # NBER
-        print("\n  [NBER]")
-        try:
-            nber_papers = self.nber_collector.fetch_recent(days=days, max_results=50)
-            all_papers.extend(nber_papers)
-        except Exception as e:
-            print(f"  Error collecting from NBER: {e}")
-        
+
+        # Each source is network-bound and independent, so fetch them in
+        # parallel; wall time becomes max(sources) instead of their sum.
+        sources = [
+            ("arXiv", self.arxiv_collector.fetch_recent,
+             {"days": days, "max_results": 100}),
+            ("OpenAlex", self.openalex_collector.fetch_recent,
+             {"days": max(7, days), "max_results": 100}),
+            ("NBER", self.nber_collector.fetch_recent,
+             {"days": days, "max_results": 50}),
+        ]
+
+        with ThreadPoolExecutor(max_workers=len(sources)) as executor:
+            futures = {
+                executor.submit(fetch, **kwargs): name
+                for name, fetch, kwargs in sources
+            }
+
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    all_papers.extend(future.result())
+                except Exception as e:
+                    print(f"  Error collecting from {name}: {e}")
+
         # Remove duplicates by title similarity
         unique_papers = self._deduplicate_papers(all_papers)
         
@@ -196,18 +216,20 @@ class ResearchDigest:
         return unique_papers
     
     def _deduplicate_papers(self, papers: list) -> list:
-        """Remove duplicate papers based on title"""
-        seen_titles = set()
+        """Remove duplicate papers based on a title + first-author fingerprint"""
+        seen = set()
         unique = []
-        
+
         for paper in papers:
-            # Normalize title for comparison
-            title_key = paper.title.lower().strip()[:100]
-            
-            if title_key not in seen_titles:
-                seen_titles.add(title_key)
+            # Fingerprint the full normalized title (no prefix truncation,
+            # which produced false positives) plus the first author
+            first_author = paper.authors[0] if paper.authors else ""
+            key = _fingerprint(f"{paper.title.casefold().strip()}|{first_author}")
+
+            if key not in seen:
+                seen.add(key)
                 unique.append(paper)
-        
+
         return unique
     
     def _save_digest(self, papers: list, period: str):
@@ -219,14 +241,38 @@ class ResearchDigest:
             "generated_at": datetime.now().isoformat(),
             "period": period,
             "paper_count": len(papers),
-            "papers": [p.to_dict() for p in papers]
         }
-        
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2)
-        
+
+        # Enrich each paper with precomputed display fields so the
+        # dashboard reads them instead of recomputing on every rerun
+        data["papers"] = [self._paper_payload(p) for p in papers]
+
+        # Compact output: the dashboard is the only reader of these files,
+        # and pretty-printing roughly doubles both file size and parse time
+        if orjson:
+            filepath.write_bytes(orjson.dumps(data))
+        else:
+            with open(filepath, 'w', encoding='utf-8') as f:
+                json.dump(data, f, separators=(',', ':'), ensure_ascii=False)
+
         print(f"  Saved digest data to: {filepath}")
     
+    @staticmethod
+    def _paper_payload(paper) -> dict:
+        """Paper dict enriched with precomputed display fields"""
+        d = paper.to_dict()
+
+        authors = paper.authors or []
+        d['authors_display'] = ", ".join(authors[:3]) + (" et al." if len(authors) > 3 else "")
+
+        title = paper.title or ""
+        d['title_short'] = title if len(title) <= 80 else title[:80] + "..."
+
+        abstract = paper.abstract or ""
+        d['abstract_preview'] = abstract if len(abstract) <= 500 else abstract[:500] + "..."
+
+        return d
+
     def _save_html(self, html_content: str, period: str):
         """Save HTML digest to file"""
         filename = f"{period}_digest_{datetime.now().strftime('%Y%m%d')}.html"
@@ -0,0 +1,115 @@
+"""
+Shared HTTP caching for collectors.
+
+When requests-cache is installed, sessions from make_session are backed
+by an on-disk sqlite cache that stores ETag/Last-Modified headers and
+sends conditional requests, so an unchanged upstream response costs a
+304 with no body instead of a full payload transfer.
+
+requests-cache only wraps requests.Session; the collectors' async paths
+talk straight aiohttp, so AsyncHTTPCache gives those requests the same
+revalidation behaviour. It only pays off for URLs that are stable
+across runs (the arXiv category queries) -- queries whose URLs embed
+dates or cursor tokens can never revalidate.
+"""
+import base64
+import gzip
+import json
+import requests
+from pathlib import Path
+from urllib.parse import urlencode
+
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+_CACHE_PATH = Path(__file__).parent.parent.parent / "data" / "http_cache"
+_ASYNC_CACHE_PATH = Path(__file__).parent.parent.parent / "data" / "async_http_cache.json"
+
+
+def make_session(expire_after: int = 3600,
+                 allowable_methods=('GET',)) -> requests.Session:
+    """Create an HTTP session, disk-cached when requests-cache is available.
+
+    Args:
+        expire_after: Default cache TTL in seconds
+        allowable_methods: HTTP methods to cache (add 'HEAD' for
+            existence checks against stable redirects like doi.org)
+    """
+    if requests_cache:
+        return requests_cache.CachedSession(
+            cache_name=str(_CACHE_PATH),
+            backend="sqlite",
+            expire_after=expire_after,
+            allowable_methods=allowable_methods,
+            cache_control=True,
+        )
+
+    return requests.Session()
+
+
+class AsyncHTTPCache:
+    """ETag/Last-Modified revalidation for aiohttp GETs.
+
+    Stores each response's validators and gzipped body in a JSON
+    sidecar; a later fetch of the same URL sends If-None-Match /
+    If-Modified-Since and replays the stored body on a 304. Responses
+    without validators are passed through and never stored.
+    """
+
+    def __init__(self, path: Path = _ASYNC_CACHE_PATH):
+        self.path = path
+        try:
+            self._entries = json.loads(path.read_text())
+        except (OSError, ValueError):
+            self._entries = {}
+        self._dirty = False
+
+    @staticmethod
+    def _key(url: str, params) -> str:
+        if params:
+            return url + '?' + urlencode(sorted(params.items()))
+        return url
+
+    async def fetch(self, session, url: str, params=None, **kwargs) -> bytes:
+        """GET with conditional headers; replays the cached body on 304"""
+        key = self._key(url, params)
+        entry = self._entries.get(key)
+
+        headers = {}
+        if entry:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+
+        async with session.get(
+            url, params=params, headers=headers or None, **kwargs
+        ) as response:
+            if response.status == 304 and entry:
+                return gzip.decompress(base64.b64decode(entry['body']))
+            response.raise_for_status()
+            content = await response.read()
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+
+        if etag or last_modified:
+            self._entries[key] = {
+                'etag': etag,
+                'last_modified': last_modified,
+                'body': base64.b64encode(gzip.compress(content)).decode(),
+            }
+            self._dirty = True
+
+        return content
+
+    def save(self):
+        """Write new validators and bodies back to disk (best-effort)"""
+        if not self._dirty:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text(json.dumps(self._entries))
+        except OSError as e:
+            print(f"  Could not save async HTTP cache: {e}")
@@ -4,12 +4,38 @@ NBER Working Papers Collector
 Fetches recent working papers from NBER RSS feed.
 """
 import requests
-import xml.etree.ElementTree as ET
+from io import BytesIO
 from datetime import datetime, timedelta
 from typing import List, Optional
 import re
 
+try:
+    # libxml2-backed parser: C-level parsing, much faster than stdlib
+    from lxml import etree as ET
+    # lxml's iterparse can select <item> at the C level, so elements
+    # outside the channel/item structure never surface in Python
+    _ITERPARSE_KW = {'tag': 'item'}
+except ImportError:
+    import xml.etree.ElementTree as ET
+    _ITERPARSE_KW = {}
+
+import html
+
 from .arxiv_collector import Paper
+from .http_cache import make_session
+from .openalex_collector import _cap
+
+# Compiled once; _parse_item runs per RSS item
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_NBER_ID_RE = re.compile(r'/papers/w(\d+)')
+
+# RFC-822 month names; a dict lookup replaces the locale-aware strptime
+# machinery for the feed's fixed-format dates
+_MONTHS = {
+    'Jan': '01', 'Feb': '02', 'Mar': '03', 'Apr': '04',
+    'May': '05', 'Jun': '06', 'Jul': '07', 'Aug': '08',
+    'Sep': '09', 'Oct': '10', 'Nov': '11', 'Dec': '12',
+}
 
 
 class NBERCollector:
@@ -18,7 +44,7 @@ class NBERCollector:
     RSS_URL = "https://www.nber.org/rss/new.xml"
     
     def __init__(self):
-        self.session = requests.Session()
+        self.session = make_session()
         self.session.headers.update({
             "User-Agent": "ResearchDigest/1.0"
         })
@@ -52,17 +78,27 @@ class NBERCollector:
         papers = []
         
         try:
-            root = ET.fromstring(xml_text)
-            
-            # Find all items in the RSS feed
-            for item in root.findall(".//item")[:max_results]:
+            # Stream items out of the feed as they close instead of
+            # materializing the whole tree first
+            for _event, item in ET.iterparse(
+                BytesIO(xml_text.encode()), events=('end',), **_ITERPARSE_KW
+            ):
+                # No-op under lxml (tag= already filtered); needed for
+                # the stdlib parser, which yields every closing element
+                if item.tag != 'item':
+                    continue
+
                 paper = self._parse_item(item)
                 if paper:
                     papers.append(paper)
-                    
+                item.clear()
+
+                if len(papers) >= max_results:
+                    break
+
         except ET.ParseError as e:
             print(f"  Error parsing RSS: {e}")
-            
+
         return papers
     
     def _parse_item(self, item) -> Optional[Paper]:
@@ -78,8 +114,8 @@ class NBERCollector:
             description = item.find("description")
             abstract = description.text.strip() if description is not None else ""
             
-            # Clean up abstract (remove HTML tags)
-            abstract = re.sub(r'<[^>]+>', '', abstract)
+            # Clean up abstract (strip HTML tags, resolve entity refs)
+            abstract = html.unescape(_HTML_TAG_RE.sub('', abstract))
             
             pub_date = item.find("pubDate")
             pub_date_str = pub_date.text if pub_date is not None else ""
@@ -88,16 +124,17 @@ class NBERCollector:
             published_date = ""
             if pub_date_str:
                 try:
-                    # NBER format: "Mon, 01 Jan 2024 00:00:00 -0500"
-                    dt = datetime.strptime(pub_date_str[:16], "%a, %d %b %Y")
-                    published_date = dt.strftime("%Y-%m-%d")
+                    # NBER format: "Mon, 01 Jan 2024 00:00:00 -0500";
+                    # fixed positions, so split + month lookup beats strptime
+                    parts = pub_date_str.split()
+                    published_date = f"{parts[3]}-{_MONTHS[parts[2]]}-{parts[1].zfill(2)}"
                 except:
                     published_date = pub_date_str[:10]
             
             # Extract NBER ID from URL
             nber_id = ""
             if url:
-                match = re.search(r'/papers/w(\d+)', url)
+                match = _NBER_ID_RE.search(url)
                 if match:
                     nber_id = f"w{match.group(1)}"
             
@@ -111,7 +148,7 @@ class NBERCollector:
             return Paper(
                 title=title,
                 authors=authors,
-                abstract=abstract[:2000],
+                abstract=_cap(abstract),
                 url=url,
                 pdf_url=url.replace("/papers/", "/system/files/working_papers/") + ".pdf" if url else "",
                 source="nber",
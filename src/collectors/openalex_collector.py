@@ -5,13 +5,39 @@ Fetches recent papers from OpenAlex API.
 OpenAlex is free and covers all major academic journals.
 API docs: https://docs.openalex.org/
 """
+import asyncio
+import json
 import requests
 from datetime import datetime, timedelta
+from pathlib import Path
 from typing import List, Optional
-from dataclasses import dataclass, asdict
 import time
 
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    # Rust-backed parser; OpenAlex responses are 50-200 KB of deeply
+    # nested JSON, where it handily beats the stdlib tokenizer
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    import json
+    _loads = json.loads
+
 from .arxiv_collector import Paper
+from .http_cache import make_session
+
+def _cap(s: str, n: int = 2000) -> str:
+    """Truncate to n chars without allocating when already short enough"""
+    return s if len(s) <= n else s[:n]
+
+
+# Journal-name -> OpenAlex source ID lookups change essentially never,
+# so they are resolved once and kept in a JSON sidecar
+_SOURCE_ID_CACHE = Path(__file__).parent.parent.parent / "data" / "openalex_source_ids.json"
 
 
 class OpenAlexCollector:
@@ -50,6 +76,17 @@ class OpenAlexCollector:
         "Utilities Policy",
     ]
     
+    # OpenAlex concept IDs for relevant topics
+    # These are stable identifiers for concepts
+    CONCEPTS = [
+        "C162324750",  # Economics
+        "C10138342",   # Mechanism design
+        "C107457646",  # Auction theory
+        "C2776384193", # Energy economics
+        "C39549134",   # Environmental economics
+        "C175444787",  # Industrial organization
+    ]
+
     def __init__(self, email: str = "leopold.monjoie@aalto.fi", journals: List[str] = None):
         """
         Initialize collector
@@ -60,7 +97,7 @@ class OpenAlexCollector:
         """
         self.email = email
         self.journals = journals or self.JOURNALS
-        self.session = requests.Session()
+        self.session = make_session()
         self.session.headers.update({
             "User-Agent": f"ResearchDigest/1.0 (mailto:{email})"
         })
@@ -84,121 +121,212 @@ class OpenAlexCollector:
         to_date = end_date.strftime("%Y-%m-%d")
         
         print(f"  Fetching OpenAlex papers from {from_date} to {to_date}")
-        
-        all_papers = []
-        
-        # Method 1: Search by keywords in relevant concepts
-        keyword_papers = self._fetch_by_concepts(from_date, to_date, max_results // 2)
-        all_papers.extend(keyword_papers)
-        
-        # Method 2: Search top journals
-        journal_papers = self._fetch_from_journals(from_date, to_date, max_results // 2)
-        all_papers.extend(journal_papers)
-        
-        # Remove duplicates
-        seen_ids = set()
-        unique_papers = []
-        for paper in all_papers:
-            if paper.source_id not in seen_ids:
-                seen_ids.add(paper.source_id)
-                unique_papers.append(paper)
-        
+
+        # One OR'd filter over all concepts and one over all journals:
+        # 2 cursor-paged queries instead of one request per concept/journal
+        queries = [
+            (self._concept_query(from_date, to_date), max_results // 2),
+            (self._journal_query(from_date, to_date), max_results // 2),
+        ]
+        queries = [(params, cap) for params, cap in queries if params]
+
+        if aiohttp:
+            # Both queries run concurrently
+            all_papers = asyncio.run(self._fetch_all_async(queries, max_results))
+        else:
+            all_papers = []
+            for params, cap in queries:
+                all_papers.extend(self._fetch_works(params, cap))
+                time.sleep(0.3)  # Rate limiting
+
+        # Remove duplicates: one insertion-ordered dict build instead of
+        # a branchy seen-set loop
+        unique_papers = list(
+            {p.source_id: p for p in all_papers if p.source_id}.values()
+        )
+
         print(f"  Found {len(unique_papers)} unique papers from OpenAlex")
         return unique_papers
     
-    def _fetch_by_concepts(self, from_date: str, to_date: str, max_results: int) -> List[Paper]:
-        """Fetch papers by relevant concepts/keywords"""
-        
-        # OpenAlex concept IDs for relevant topics
-        # These are stable identifiers for concepts
-        concepts = [
-            "C162324750",  # Economics
-            "C10138342",   # Mechanism design
-            "C107457646",  # Auction theory
-            "C2776384193", # Energy economics
-            "C39549134",   # Environmental economics
-            "C175444787",  # Industrial organization
-        ]
-        
+    def _concept_query(self, from_date: str, to_date: str) -> Optional[dict]:
+        """Single query params covering all relevant concepts (OR'd)"""
+        concepts_filter = "|".join(self.CONCEPTS)
+        return {
+            "filter": f"concepts.id:{concepts_filter},from_publication_date:{from_date},to_publication_date:{to_date}",
+            "sort": "publication_date:desc",
+            "per_page": 200,
+            "mailto": self.email
+        }
+
+    def _journal_query(self, from_date: str, to_date: str) -> Optional[dict]:
+        """Single query params covering all monitored journals (OR'd).
+
+        display_name.search does not support the | operator, so journal
+        names are resolved to OpenAlex source IDs first (cached on disk)
+        and the filter ORs over those.
+        """
+        source_ids = self._resolve_source_ids(self.journals)
+        if not source_ids:
+            return None
+
+        sources_filter = "|".join(source_ids)
+        return {
+            "filter": f"primary_location.source.id:{sources_filter},from_publication_date:{from_date},to_publication_date:{to_date}",
+            "sort": "publication_date:desc",
+            "per_page": 200,
+            "mailto": self.email
+        }
+
+    def _resolve_source_ids(self, journal_names: List[str]) -> List[str]:
+        """Map journal display names to OpenAlex source IDs, with a JSON
+        sidecar cache so the per-journal lookups happen once, not per run"""
+        try:
+            cache = json.loads(_SOURCE_ID_CACHE.read_text())
+        except (OSError, ValueError):
+            cache = {}
+
+        missing = [name for name in journal_names if name not in cache]
+        for name in missing:
+            try:
+                response = self.session.get(
+                    f"{self.BASE_URL}/sources",
+                    params={
+                        "filter": f"display_name.search:{name}",
+                        "per_page": 1,
+                        "select": "id",
+                        "mailto": self.email
+                    },
+                    timeout=30
+                )
+                response.raise_for_status()
+                results = _loads(response.content).get("results", [])
+                cache[name] = (
+                    results[0]["id"].replace("https://openalex.org/", "")
+                    if results else ""
+                )
+            except Exception as e:
+                print(f"    Error resolving source ID for {name}: {e}")
+
+        if missing:
+            try:
+                _SOURCE_ID_CACHE.parent.mkdir(parents=True, exist_ok=True)
+                _SOURCE_ID_CACHE.write_text(json.dumps(cache, indent=2))
+            except OSError as e:
+                print(f"    Could not write source ID cache: {e}")
+
+        return [cache[name] for name in journal_names if cache.get(name)]
+
+    def _fetch_works(self, params: dict, max_records: int) -> List[Paper]:
+        """Run a /works query with cursor paging until max_records"""
         papers = []
-        
-        for concept_id in concepts[:3]:  # Limit to avoid too many requests
+        params = dict(params, cursor="*")
+
+        while len(papers) < max_records:
             try:
-                url = f"{self.BASE_URL}/works"
-                params = {
-                    "filter": f"concepts.id:{concept_id},from_publication_date:{from_date},to_publication_date:{to_date}",
-                    "sort": "publication_date:desc",
-                    "per_page": min(50, max_results // 3),
-                    "mailto": self.email
-                }
-                
-                response = self.session.get(url, params=params, timeout=30)
+                response = self.session.get(f"{self.BASE_URL}/works", params=params, timeout=30)
                 response.raise_for_status()
-                
-                data = response.json()
-                for work in data.get("results", []):
-                    paper = self._parse_work(work)
-                    if paper:
-                        papers.append(paper)
-                        
-                time.sleep(0.5)  # Rate limiting
-                
+                data = _loads(response.content)
             except Exception as e:
-                print(f"    Error fetching concept {concept_id}: {e}")
-                continue
-                
-        return papers
-    
-    def _fetch_from_journals(self, from_date: str, to_date: str, max_results: int) -> List[Paper]:
-        """Fetch recent papers from top journals"""
-        
+                print(f"    Error fetching OpenAlex works: {e}")
+                break
+
+            papers.extend(p for p in map(self._parse_work, data.get("results", [])) if p)
+
+            cursor = data.get("meta", {}).get("next_cursor")
+            if not cursor or not data.get("results"):
+                break
+            params["cursor"] = cursor
+
+        return papers[:max_records]
+
+    async def _fetch_all_async(self, queries: list,
+                               max_results: int) -> List[Paper]:
+        """Run the /works queries concurrently, bailing out early.
+
+        Results are consumed as each query finishes; once max_results
+        unique papers are in hand the remaining tasks are cancelled, so
+        in-flight cursor pages stop instead of fetching work that would
+        be trimmed anyway.
+        """
+        # A plain session on purpose: the query URLs embed the moving
+        # from/to publication dates and per-run cursor tokens, so
+        # conditional revalidation could never hit. The cached
+        # make_session is reserved for the stable /sources lookups.
+        connector = aiohttp.TCPConnector(limit_per_host=4)
+        async with aiohttp.ClientSession(
+            connector=connector, headers=dict(self.session.headers)
+        ) as session:
+            tasks = [
+                asyncio.create_task(self._fetch_works_async(session, params, cap))
+                for params, cap in queries
+            ]
+
+            seen = {}
+            for future in asyncio.as_completed(tasks):
+                try:
+                    papers = await future
+                except asyncio.CancelledError:
+                    continue
+                for paper in papers:
+                    seen.setdefault(paper.source_id, paper)
+                if len(seen) >= max_results:
+                    for task in tasks:
+                        task.cancel()
+                    break
+
+            # Let cancelled tasks unwind before the session closes
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        return list(seen.values())
+
+    async def _fetch_works_async(self, session, params: dict,
+                                 max_records: int) -> List[Paper]:
+        """Async version of _fetch_works (cursor pages are sequential
+        within a query; the queries themselves run concurrently)"""
         papers = []
-        papers_per_journal = max(5, max_results // len(self.journals))
-        
-        for journal_name in self.journals[:10]:  # Limit to top 10 journals
+        params = dict(params, cursor="*")
+
+        while len(papers) < max_records:
             try:
-                url = f"{self.BASE_URL}/works"
-                
-                # Search by journal name in source
-                params = {
-                    "filter": f"primary_location.source.display_name.search:{journal_name},from_publication_date:{from_date},to_publication_date:{to_date}",
-                    "sort": "publication_date:desc",
-                    "per_page": papers_per_journal,
-                    "mailto": self.email
-                }
-                
-                response = self.session.get(url, params=params, timeout=30)
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    for work in data.get("results", []):
-                        paper = self._parse_work(work)
-                        if paper:
-                            papers.append(paper)
-                            
-                time.sleep(0.3)  # Rate limiting
-                
+                async with session.get(
+                    f"{self.BASE_URL}/works", params=params,
+                    timeout=aiohttp.ClientTimeout(total=30)
+                ) as response:
+                    response.raise_for_status()
+                    data = _loads(await response.read())
             except Exception as e:
-                print(f"    Error fetching journal {journal_name}: {e}")
-                continue
-                
-        return papers
+                print(f"    Error fetching OpenAlex works: {e}")
+                break
+
+            papers.extend(p for p in map(self._parse_work, data.get("results", [])) if p)
+
+            cursor = data.get("meta", {}).get("next_cursor")
+            if not cursor or not data.get("results"):
+                break
+            params["cursor"] = cursor
+
+        return papers[:max_records]
     
     def _parse_work(self, work: dict) -> Optional[Paper]:
         """Parse an OpenAlex work into a Paper object"""
         
         try:
-            # Get basic info
+            # Cheap reject checks first: bail on unusable works before
+            # paying for abstract reconstruction or author parsing
             title = work.get("title", "")
             if not title:
                 return None
-                
+
+            source_id = work.get("id", "").replace("https://openalex.org/", "")
+            if not source_id:
+                return None
+
             # Get abstract
             abstract = ""
             if work.get("abstract_inverted_index"):
                 # OpenAlex returns inverted index, need to reconstruct
                 abstract = self._reconstruct_abstract(work["abstract_inverted_index"])
-            
+
             # Get authors
             authors = []
             for authorship in work.get("authorships", [])[:10]:
@@ -206,14 +334,11 @@ class OpenAlexCollector:
                 name = author.get("display_name", "")
                 if name:
                     authors.append(name)
-            
+
             # Get URL and DOI
             doi = work.get("doi", "")
             url = doi if doi else work.get("id", "")
-            
-            # Get source ID (OpenAlex ID)
-            source_id = work.get("id", "").replace("https://openalex.org/", "")
-            
+
             # Get publication date
             pub_date = work.get("publication_date", "")
             
@@ -236,7 +361,7 @@ class OpenAlexCollector:
             return Paper(
                 title=title,
                 authors=authors,
-                abstract=abstract[:2000],  # Limit abstract length
+                abstract=_cap(abstract),  # Limit abstract length
                 url=url,
                 pdf_url=work.get("open_access", {}).get("oa_url", ""),
                 source="openalex",
@@ -255,15 +380,18 @@ class OpenAlexCollector:
             return ""
             
         try:
-            # Create list of (position, word) tuples
-            words = []
+            # Preallocate a position-indexed slot list: one write per word
+            # occurrence, no (pos, word) tuple build and no O(N log N) sort
+            max_pos = max(
+                pos for positions in inverted_index.values() for pos in positions
+            )
+            out = [""] * (max_pos + 1)
+
             for word, positions in inverted_index.items():
                 for pos in positions:
-                    words.append((pos, word))
-            
-            # Sort by position and join
-            words.sort(key=lambda x: x[0])
-            return " ".join(word for _, word in words)
+                    out[pos] = word
+
+            return " ".join(word for word in out if word)
         except:
             return ""
 
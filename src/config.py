@@ -3,6 +3,7 @@ Configuration loader for the Research Digest system
 """
 import os
 import yaml
+from functools import lru_cache
 from pathlib import Path
 from dataclasses import dataclass
 from typing import List, Dict, Optional
@@ -12,12 +13,17 @@ PROJECT_ROOT = Path(__file__).parent.parent
 CONFIG_DIR = PROJECT_ROOT / "config"
 DATA_DIR = PROJECT_ROOT / "data"
 
+# libyaml-backed loader when PyYAML was built against it; parses several
+# times faster than the pure-Python SafeLoader
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
 
+
+@lru_cache(maxsize=None)
 def load_yaml(filename: str) -> dict:
-    """Load a YAML configuration file"""
+    """Load a YAML configuration file (parsed once per process)"""
     filepath = CONFIG_DIR / filename
     with open(filepath, 'r') as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=_YAML_LOADER)
 
 
 @dataclass
@@ -4,8 +4,37 @@ Email Sender
 Sends digest emails using SendGrid API.
 Free tier: 100 emails/day
 """
+import asyncio
+import gzip
 import os
-from typing import Optional
+from datetime import datetime
+from functools import lru_cache
+from typing import List, Optional
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    # Imported once at module load instead of inside every send call
+    from sendgrid.helpers.mail import Mail, Email, To, Content, Personalization
+except ImportError:
+    Mail = Email = To = Content = Personalization = None
+
+# SendGrid v3 mail endpoint, for async sends that bypass the sync client
+_SENDGRID_SEND_URL = "https://api.sendgrid.com/v3/mail/send"
+
+# Bounded to SendGrid's documented ~14 msg/s quota ceiling
+_SEND_CONCURRENCY = 14
+
+
+@lru_cache(maxsize=4)
+def _get_sendgrid_client(api_key: str):
+    """One SendGrid client per API key, shared across EmailSender
+    instances; client construction sets up its own HTTP session"""
+    from sendgrid import SendGridAPIClient
+    return SendGridAPIClient(api_key)
 
 
 class EmailSender:
@@ -20,6 +49,7 @@ class EmailSender:
         """
         self.api_key = api_key or os.getenv("SENDGRID_API_KEY")
         self.client = None
+        self._dir_ensured = False
         
         # Debug: Check if API key is present (don't print the actual key!)
         print(f"  [DEBUG] SENDGRID_API_KEY present: {bool(self.api_key)}")
@@ -28,8 +58,7 @@ class EmailSender:
         
         if self.api_key:
             try:
-                from sendgrid import SendGridAPIClient
-                self.client = SendGridAPIClient(self.api_key)
+                self.client = _get_sendgrid_client(self.api_key)
                 print("  [DEBUG] SendGrid client initialized successfully")
             except ImportError:
                 print("Warning: sendgrid package not installed. Email sending disabled.")
@@ -47,15 +76,43 @@ class EmailSender:
         from_email: str = None
     ) -> bool:
         """
-        Send a digest email
-        
+        Send a digest email to a single recipient
+
         Args:
             to_email: Recipient email address
             subject: Email subject
             html_content: HTML body
             plain_content: Plain text body (fallback)
             from_email: Sender email address
-            
+
+        Returns:
+            True if sent successfully
+        """
+        return self.send_digest_bulk(
+            [to_email], subject, html_content, plain_content, from_email
+        )
+
+    def send_digest_bulk(
+        self,
+        to_emails: List[str],
+        subject: str,
+        html_content: str,
+        plain_content: str = "",
+        from_email: str = None
+    ) -> bool:
+        """
+        Send a digest email to multiple recipients in one API call
+
+        SendGrid accepts up to 1000 personalizations per request, so one
+        HTTP call covers every subscriber instead of one call each.
+
+        Args:
+            to_emails: Recipient email addresses
+            subject: Email subject
+            html_content: HTML body
+            plain_content: Plain text body (fallback)
+            from_email: Sender email address
+
         Returns:
             True if sent successfully
         """
@@ -63,50 +120,134 @@ class EmailSender:
             print("Email client not configured. Skipping send.")
             self._save_locally(html_content, subject)
             return False
-        
+
         from_email = from_email or os.getenv("SENDGRID_FROM_EMAIL", "digest@research-digest.com")
         print(f"  [DEBUG] Sending from: {from_email}")
-        print(f"  [DEBUG] Sending to: {to_email}")
-        
+        print(f"  [DEBUG] Sending to {len(to_emails)} recipient(s)")
+
         try:
-            from sendgrid.helpers.mail import Mail, Email, To, Content
-            
-            message = Mail(
-                from_email=Email(from_email, "Research Digest"),
-                to_emails=To(to_email),
-                subject=subject
-            )
-            
+            message = Mail(from_email=Email(from_email, "Research Digest"))
+            message.subject = subject
+
+            for addr in to_emails:
+                personalization = Personalization()
+                personalization.add_to(To(addr))
+                message.add_personalization(personalization)
+
             message.add_content(Content("text/plain", plain_content or "Please view in HTML."))
             message.add_content(Content("text/html", html_content))
-            
+
             response = self.client.send(message)
-            
+
             if response.status_code in [200, 201, 202]:
-                print(f"✓ Email sent successfully to {to_email}")
+                print(f"✓ Email sent successfully to {len(to_emails)} recipient(s)")
                 return True
             else:
                 print(f"✗ Email failed with status {response.status_code}")
                 print(f"  Response body: {response.body}")
                 self._save_locally(html_content, subject)
                 return False
-                
+
         except Exception as e:
             print(f"✗ Error sending email: {e}")
             self._save_locally(html_content, subject)
             return False
     
+    async def send_digest_async(self, session, sem, to_email: str,
+                                subject: str, html_content: str,
+                                plain_content: str = "",
+                                from_email: str = None) -> bool:
+        """Send one digest email by POSTing directly to the v3 API"""
+        from_email = from_email or os.getenv("SENDGRID_FROM_EMAIL", "digest@research-digest.com")
+
+        payload = {
+            "personalizations": [{"to": [{"email": to_email}]}],
+            "from": {"email": from_email, "name": "Research Digest"},
+            "subject": subject,
+            "content": [
+                {"type": "text/plain", "value": plain_content or "Please view in HTML."},
+                {"type": "text/html", "value": html_content},
+            ],
+        }
+
+        async with sem:
+            try:
+                async with session.post(
+                    _SENDGRID_SEND_URL,
+                    json=payload,
+                    headers={"Authorization": f"Bearer {self.api_key}"},
+                    timeout=aiohttp.ClientTimeout(total=30),
+                ) as response:
+                    if response.status in [200, 201, 202]:
+                        return True
+                    print(f"✗ Email to {to_email} failed with status {response.status}")
+                    return False
+            except Exception as e:
+                print(f"✗ Error sending email to {to_email}: {e}")
+                return False
+
+    def send_digest_many(
+        self,
+        to_emails: List[str],
+        subject: str,
+        html_content: str,
+        plain_content: str = "",
+        from_email: str = None
+    ) -> int:
+        """
+        Send individual digest copies to many recipients concurrently
+
+        Unlike send_digest_bulk (one request, shared message), each
+        recipient gets their own API call; the semaphore keeps the
+        fan-out at SendGrid's per-second quota. Useful when copies need
+        to diverge per recipient.
+
+        Returns:
+            Number of emails sent successfully
+        """
+        if not (self.api_key and aiohttp):
+            # No key or no aiohttp: fall back to the single bulk send
+            ok = self.send_digest_bulk(
+                to_emails, subject, html_content, plain_content, from_email
+            )
+            return len(to_emails) if ok else 0
+
+        async def _send_all():
+            sem = asyncio.Semaphore(_SEND_CONCURRENCY)
+            async with aiohttp.ClientSession() as session:
+                return await asyncio.gather(*[
+                    self.send_digest_async(
+                        session, sem, addr, subject,
+                        html_content, plain_content, from_email
+                    )
+                    for addr in to_emails
+                ])
+
+        results = asyncio.run(_send_all())
+        sent = sum(results)
+        print(f"✓ Sent {sent}/{len(to_emails)} digest emails")
+        return sent
+
     def _save_locally(self, html_content: str, subject: str):
-        """Save email locally when sending fails"""
-        from datetime import datetime
-        
-        filename = f"digest_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html"
-        filepath = os.path.join(os.path.dirname(__file__), "..", "..", "data", filename)
-        
+        """Save email locally (gzipped) when sending fails"""
+        # Digest HTML is highly repetitive markup; gzip shrinks the
+        # archived copies 5-10x for negligible CPU
+        filename = f"digest_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html.gz"
+        dirpath = os.path.join(os.path.dirname(__file__), "..", "..", "data")
+        filepath = os.path.join(dirpath, filename)
+
         try:
-            os.makedirs(os.path.dirname(filepath), exist_ok=True)
-            with open(filepath, 'w') as f:
+            if not self._dir_ensured:
+                os.makedirs(dirpath, exist_ok=True)
+                self._dir_ensured = True
+
+            # Write to a temp file and rename into place so a crash
+            # mid-write never leaves a truncated archive behind
+            tmp_path = filepath + ".tmp"
+            with gzip.open(tmp_path, 'wt', encoding='utf-8', compresslevel=6) as f:
                 f.write(html_content)
+            os.replace(tmp_path, filepath)
+
             print(f"  Digest saved locally to: {filepath}")
         except Exception as e:
             print(f"  Could not save locally: {e}")
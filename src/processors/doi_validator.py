@@ -9,22 +9,133 @@ We validate papers exist by checking:
 2. arXiv ID existence via arXiv API
 3. OpenAlex ID existence via OpenAlex API
 """
+import asyncio
+import json
 import requests
+from requests.adapters import HTTPAdapter, Retry
+from pathlib import Path
 from typing import Optional, Tuple
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import time
 
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    from collectors.http_cache import make_session
+except ImportError:
+    # Running the module directly (python doi_validator.py)
+    def make_session(expire_after=3600, allowable_methods=('GET',)):
+        return requests.Session()
+
+# The digest re-validates heavily overlapping IDs day after day, so
+# results are kept on disk between runs. Positive results are stable for
+# a long time; negatives get a short TTL in case a paper appears later.
+_CACHE_PATH = Path(__file__).parent.parent.parent / "data" / "validator_cache.json"
+_POSITIVE_TTL = 30 * 86400  # 30 days
+_NEGATIVE_TTL = 86400       # 1 day
+
 
 class PaperValidator:
     """Validates that papers actually exist"""
     
     def __init__(self):
-        self.session = requests.Session()
+        # doi.org and arXiv redirects are stable for years; with
+        # requests-cache installed, repeat HEAD/GET checks become disk
+        # hits instead of network round-trips
+        self.session = make_session(
+            expire_after=30 * 86400,
+            allowable_methods=('GET', 'HEAD'),
+        )
         self.session.headers.update({
             "User-Agent": "ResearchDigest/1.0 (paper-validator)"
         })
-        # Cache validation results to avoid repeated checks
+        # Validation HEADs hit the same few hosts (arxiv.org, doi.org,
+        # api.openalex.org) over and over; a pool sized for the batch
+        # workers keeps connections warm instead of paying a TCP+TLS
+        # handshake per paper, with retries for transient upstream errors
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=2,
+                backoff_factor=0.3,
+                status_forcelist=[429, 502, 503, 504],
+            ),
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        # Cache validation results to avoid repeated checks; persisted
+        # across runs so steady-state days skip most validation HTTP
         self._cache = {}
+        self._cache_ts = {}
+        # key -> (etag, last_modified) captured from validated responses
+        self._cache_meta = {}
+        # Expired positive entries with validators: revalidated with a
+        # conditional request, where a 304 is a body-free "still valid"
+        self._stale = {}
+        self._load_cache()
+
+    def _load_cache(self):
+        """Load non-expired validation results from the disk cache"""
+        try:
+            entries = json.loads(_CACHE_PATH.read_text())
+        except (OSError, ValueError):
+            return
+
+        now = time.time()
+        for key, entry in entries.items():
+            try:
+                ttl = _POSITIVE_TTL if entry["valid"] else _NEGATIVE_TTL
+                if now - entry["ts"] <= ttl:
+                    self._cache[key] = (entry["valid"], entry["reason"])
+                    self._cache_ts[key] = entry["ts"]
+                    if entry.get("etag") or entry.get("last_modified"):
+                        self._cache_meta[key] = (
+                            entry.get("etag"), entry.get("last_modified")
+                        )
+                elif entry["valid"] and (entry.get("etag") or entry.get("last_modified")):
+                    self._stale[key] = entry
+            except (KeyError, TypeError):
+                continue
+
+    def _cache_put(self, key: str, result: Tuple[bool, str],
+                   etag: str = None, last_modified: str = None):
+        """Record a validation result with its timestamp and validators"""
+        self._cache[key] = result
+        self._cache_ts[key] = time.time()
+        if etag or last_modified:
+            self._cache_meta[key] = (etag, last_modified)
+
+    @staticmethod
+    def _conditional_headers(entry: dict) -> dict:
+        """If-None-Match/If-Modified-Since headers for a stale entry"""
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def save_cache(self):
+        """Write the validation cache back to disk"""
+        entries = {}
+        for key, (is_valid, reason) in self._cache.items():
+            etag, last_modified = self._cache_meta.get(key, (None, None))
+            entries[key] = {
+                "valid": is_valid,
+                "reason": reason,
+                "ts": self._cache_ts.get(key, time.time()),
+                "etag": etag,
+                "last_modified": last_modified,
+            }
+        try:
+            _CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            _CACHE_PATH.write_text(json.dumps(entries))
+        except OSError as e:
+            print(f"  Could not save validation cache: {e}")
         
     def validate_paper(self, paper) -> Tuple[bool, str]:
         """
@@ -40,24 +151,47 @@ class PaperValidator:
         cache_key = f"{paper.source}:{paper.source_id}"
         if cache_key in self._cache:
             return self._cache[cache_key]
-        
-        result = (False, "Unknown source")
-        
-        if paper.source == "arxiv":
-            result = self._validate_arxiv(paper.source_id)
-        elif paper.source == "openalex":
-            result = self._validate_openalex(paper.source_id)
-        elif paper.source == "nber":
-            result = self._validate_nber(paper.url)
-        elif paper.url and "doi.org" in paper.url:
-            doi = paper.url.replace("https://doi.org/", "")
-            result = self._validate_doi(doi)
-        else:
-            # For papers with URLs, just check the URL is accessible
-            result = self._validate_url(paper.url)
-        
-        # Cache result
-        self._cache[cache_key] = result
+
+        method, url, label = self._validation_request(paper)
+
+        if not url:
+            result = (False, f"No {label} provided")
+            self._cache_put(cache_key, result)
+            return result
+
+        # Expired positive entry with validators: a conditional request
+        # turns "still unchanged" into a body-free 304
+        stale = self._stale.get(cache_key)
+        headers = self._conditional_headers(stale) if stale else None
+
+        try:
+            response = self.session.request(
+                method, url, headers=headers, allow_redirects=True, timeout=10
+            )
+
+            if stale and response.status_code == 304:
+                # Unchanged upstream: keep the entry, bump its timestamp
+                result = (stale["valid"], stale["reason"])
+                self._cache_put(cache_key, result,
+                                etag=stale.get("etag"),
+                                last_modified=stale.get("last_modified"))
+                return result
+
+            if response.status_code == 200:
+                result = (True, f"{label} validated")
+                self._cache_put(cache_key, result,
+                                etag=response.headers.get("ETag"),
+                                last_modified=response.headers.get("Last-Modified"))
+                return result
+
+            result = (False, f"{label} not found (status {response.status_code})")
+
+        except requests.Timeout:
+            result = (False, f"{label} validation timeout")
+        except Exception as e:
+            result = (False, f"{label} validation error: {str(e)}")
+
+        self._cache_put(cache_key, result)
         return result
     
     def _validate_doi(self, doi: str) -> Tuple[bool, str]:
@@ -100,55 +234,117 @@ class PaperValidator:
         except Exception as e:
             return (False, f"arXiv validation error: {str(e)}")
     
-    def _validate_openalex(self, openalex_id: str) -> Tuple[bool, str]:
-        """Validate an OpenAlex work exists"""
-        if not openalex_id:
-            return (False, "No OpenAlex ID provided")
-        
-        try:
-            url = f"https://api.openalex.org/works/{openalex_id}"
-            response = self.session.get(url, timeout=10)
-            
-            if response.status_code == 200:
-                return (True, "OpenAlex ID validated")
-            else:
-                return (False, f"OpenAlex work not found (status {response.status_code})")
-                
-        except Exception as e:
-            return (False, f"OpenAlex validation error: {str(e)}")
-    
-    def _validate_nber(self, url: str) -> Tuple[bool, str]:
-        """Validate an NBER paper exists"""
-        if not url:
-            return (False, "No NBER URL provided")
-        
-        try:
-            response = self.session.head(url, allow_redirects=True, timeout=10)
-            
-            if response.status_code == 200:
-                return (True, "NBER paper validated")
-            else:
-                return (False, f"NBER paper not found (status {response.status_code})")
-                
-        except Exception as e:
-            return (False, f"NBER validation error: {str(e)}")
-    
-    def _validate_url(self, url: str) -> Tuple[bool, str]:
-        """Generic URL validation"""
+    @staticmethod
+    def _validation_request(paper) -> Tuple[str, str, str]:
+        """Map a paper to (method, url, label) for its existence check"""
+        if paper.source == "arxiv":
+            return ("HEAD", f"https://arxiv.org/abs/{paper.source_id}", "arXiv ID")
+        elif paper.source == "openalex":
+            return ("GET", f"https://api.openalex.org/works/{paper.source_id}", "OpenAlex ID")
+        elif paper.source == "nber":
+            return ("HEAD", paper.url, "NBER paper")
+        elif paper.url and "doi.org" in paper.url:
+            return ("HEAD", paper.url, "DOI")
+        else:
+            return ("HEAD", paper.url, "URL")
+
+    async def _avalidate(self, paper, client, sem) -> Tuple[bool, str]:
+        """Async existence check for a single paper"""
+        cache_key = f"{paper.source}:{paper.source_id}"
+        if cache_key in self._cache:
+            return self._cache[cache_key]
+
+        method, url, label = self._validation_request(paper)
+
         if not url:
-            return (False, "No URL provided")
-        
-        try:
-            response = self.session.head(url, allow_redirects=True, timeout=10)
-            
-            if response.status_code == 200:
-                return (True, "URL validated")
-            else:
-                return (False, f"URL not accessible (status {response.status_code})")
-                
-        except Exception as e:
-            return (False, f"URL validation error: {str(e)}")
-    
+            result = (False, f"No {label} provided")
+            self._cache_put(cache_key, result)
+            return result
+
+        stale = self._stale.get(cache_key)
+        headers = self._conditional_headers(stale) if stale else None
+        etag = last_modified = None
+
+        async with sem:
+            try:
+                response = await client.request(
+                    method, url, headers=headers, follow_redirects=True
+                )
+                if stale and response.status_code == 304:
+                    result = (stale["valid"], stale["reason"])
+                    etag = stale.get("etag")
+                    last_modified = stale.get("last_modified")
+                elif response.status_code == 200:
+                    result = (True, f"{label} validated")
+                    etag = response.headers.get("ETag")
+                    last_modified = response.headers.get("Last-Modified")
+                else:
+                    result = (False, f"{label} not found (status {response.status_code})")
+            except httpx.TimeoutException:
+                result = (False, f"{label} validation timeout")
+            except Exception as e:
+                result = (False, f"{label} validation error: {str(e)}")
+
+        self._cache_put(cache_key, result, etag=etag, last_modified=last_modified)
+        return result
+
+    async def _avalidate_all(self, papers: list) -> list:
+        """Validate all papers on one async client.
+
+        In-flight HEADs multiplex over a small keep-alive pool instead of
+        holding one OS thread and socket each; the semaphore bounds
+        concurrency so arXiv/OpenAlex rate limits are not tripped.
+        """
+        sem = asyncio.Semaphore(16)
+        limits = httpx.Limits(max_connections=50, max_keepalive_connections=20)
+
+        async with httpx.AsyncClient(
+            limits=limits, timeout=10, headers=dict(self.session.headers)
+        ) as client:
+            return await asyncio.gather(*[
+                self._avalidate(paper, client, sem) for paper in papers
+            ])
+
+    def validate_openalex_bulk(self, ids: list) -> dict:
+        """Validate many OpenAlex IDs with filtered /works queries.
+
+        One filter=openalex:W1|W2|... request covers up to 50 IDs, so N
+        papers cost ceil(N/50) round-trips instead of N. Returns a dict
+        of id -> exists; IDs from failed requests are omitted so callers
+        fall back to per-paper checks for them.
+
+        Args:
+            ids: OpenAlex work IDs (e.g. "W2741809807")
+
+        Returns:
+            Dict mapping each queried ID to whether it exists
+        """
+        results = {}
+
+        for i in range(0, len(ids), 50):
+            chunk = ids[i:i + 50]
+            try:
+                response = self.session.get(
+                    "https://api.openalex.org/works",
+                    params={
+                        "filter": "openalex:" + "|".join(chunk),
+                        "per-page": 50,
+                        "select": "id",
+                    },
+                    timeout=10,
+                )
+                response.raise_for_status()
+                found = {
+                    work["id"].replace("https://openalex.org/", "")
+                    for work in response.json().get("results", [])
+                }
+                for work_id in chunk:
+                    results[work_id] = work_id in found
+            except Exception as e:
+                print(f"    Error bulk-validating OpenAlex IDs: {e}")
+
+        return results
+
     def validate_papers_batch(self, papers: list, max_workers: int = 5) -> list:
         """
         Validate a batch of papers in parallel
@@ -161,10 +357,40 @@ class PaperValidator:
             List of validated papers (invalid papers are filtered out)
         """
         print(f"  Validating {len(papers)} papers...")
-        
+
+        # OpenAlex papers can be checked in bulk; seed the cache so the
+        # per-paper paths below resolve them without any further HTTP
+        openalex_ids = [
+            paper.source_id for paper in papers
+            if paper.source == "openalex" and paper.source_id
+            and f"openalex:{paper.source_id}" not in self._cache
+        ]
+        if openalex_ids:
+            for work_id, exists in self.validate_openalex_bulk(openalex_ids).items():
+                self._cache_put(
+                    f"openalex:{work_id}",
+                    (True, "OpenAlex ID validated") if exists
+                    else (False, "OpenAlex work not found")
+                )
+
         validated_papers = []
         invalid_count = 0
-        
+
+        if httpx:
+            # Non-blocking I/O: all checks in flight at once on one client
+            results = asyncio.run(self._avalidate_all(papers))
+            for paper, (is_valid, reason) in zip(papers, results):
+                if is_valid:
+                    validated_papers.append(paper)
+                else:
+                    invalid_count += 1
+                    # Uncomment for debugging:
+                    # print(f"    ❌ Invalid: {paper.title[:50]}... - {reason}")
+
+            print(f"  ✓ Validated: {len(validated_papers)}, ❌ Invalid: {invalid_count}")
+            self.save_cache()
+            return validated_papers
+
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
             # Submit all validation tasks
             future_to_paper = {
@@ -187,6 +413,7 @@ class PaperValidator:
                     print(f"    Error validating paper: {e}")
         
         print(f"  ✓ Validated: {len(validated_papers)}, ❌ Invalid: {invalid_count}")
+        self.save_cache()
         return validated_papers
 
 
@@ -4,11 +4,47 @@ Relevance Scorer
 Scores papers based on how relevant they are to Leopold's research interests.
 Uses keyword matching with weighted categories.
 """
+import hashlib
+import json
+import pickle
 import re
+from bisect import bisect_right
 from typing import List, Dict, Tuple
 from pathlib import Path
 import yaml
 
+try:
+    # Multi-pattern DFA: one SIMD-accelerated pass reports every keyword
+    # hit at once, instead of one regex scan per category
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+try:
+    # Lighter alternative: Aho-Corasick matches all keywords in one
+    # linear C-level scan (no word boundaries, checked in Python)
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+# Compiled keyword databases are cached here, keyed by a hash of the
+# keyword lists, so unchanged configs skip recompilation at startup
+_PATTERN_CACHE_DIR = Path(__file__).parent.parent.parent / "data"
+
+
+def _boundary_ok(text: str, start: int, end: int) -> bool:
+    """Replicate \\b semantics around a match at [start, end]"""
+    if start > 0:
+        c = text[start - 1]
+        if c.isalnum() or c == '_':
+            return False
+    if end + 1 < len(text):
+        c = text[end + 1]
+        if c.isalnum() or c == '_':
+            return False
+    return True
+
 
 class RelevanceScorer:
     """Scores paper relevance based on keyword matching"""
@@ -37,13 +73,28 @@ class RelevanceScorer:
         }
         
     def _load_default_keywords(self) -> Dict:
-        """Load keywords from config file"""
+        """Load keywords from config file.
+
+        The flattened dict is mirrored to a pickle sidecar; while the
+        YAML is unchanged, later constructions skip the YAML parse
+        entirely (pickle.load is orders of magnitude faster).
+        """
         config_path = Path(__file__).parent.parent.parent / "config" / "keywords.yaml"
-        
+        pickle_path = config_path.with_suffix('.yaml.pkl')
+
+        try:
+            if pickle_path.stat().st_mtime >= config_path.stat().st_mtime:
+                return pickle.loads(pickle_path.read_bytes())
+        except Exception:
+            pass  # no/stale/corrupt sidecar; parse the YAML below
+
         try:
             with open(config_path, 'r') as f:
-                config = yaml.safe_load(f)
-            
+                # libyaml-backed loader when PyYAML was built with it
+                config = yaml.load(
+                    f, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+                )
+
             keywords = {
                 'primary': [],
                 'secondary': [],
@@ -57,9 +108,14 @@ class RelevanceScorer:
                 keywords['secondary'].extend(kw_dict)
             for category, kw_dict in config.get('tertiary_keywords', {}).items():
                 keywords['tertiary'].extend(kw_dict)
-                
+
+            try:
+                pickle_path.write_bytes(pickle.dumps(keywords))
+            except OSError:
+                pass  # sidecar write is best-effort
+
             return keywords
-            
+
         except Exception as e:
             print(f"Warning: Could not load keywords config: {e}")
             return self._get_fallback_keywords()
@@ -86,15 +142,171 @@ class RelevanceScorer:
         }
     
     def _compile_patterns(self):
-        """Compile regex patterns for all keywords"""
-        self.patterns = {}
-        
+        """Compile one alternation regex per keyword category.
+
+        A single \\b(?:kw1|kw2|...)\\b pattern scans the text once at C
+        level instead of one pattern.search per keyword; papers that
+        match nothing in a category (the common case) are settled by
+        that one scan. Alternatives are sorted longest-first so
+        multi-word keywords win over their own prefixes.
+        """
+        self.category_regex = {}
+        # Lowercase match -> keyword as written in the config
+        self._original_case = {}
+
+        for category, keywords in self.keywords.items():
+            if not keywords:
+                self.category_regex[category] = None
+                continue
+
+            # Patterns are compiled lowercase and matched against text
+            # lowered once per paper: cheaper than IGNORECASE folding
+            # every character during the scan
+            ordered = sorted(keywords, key=len, reverse=True)
+            self.category_regex[category] = re.compile(
+                r'\b(?:' + '|'.join(re.escape(k.lower()) for k in ordered) + r')\b'
+            )
+            for keyword in keywords:
+                self._original_case[keyword.lower()] = keyword
+
+        self._hs_db = None
+        self._hs_table = []
+        if hyperscan:
+            self._build_hyperscan_db()
+
+        self._ac_automaton = None
+        if ahocorasick and self._hs_db is None:
+            self._build_ac_automaton()
+
+        # Per-keyword patterns for the pure-regex fallback: a consuming
+        # findall on the alternation can't report two same-category
+        # keywords that overlap in the text ("capacity market clearing"
+        # must yield both "capacity market" and "market clearing"), so
+        # the alternation only answers "does anything match" and these
+        # recover the exact match set
+        self._category_patterns = {}
+        if self._hs_db is None and self._ac_automaton is None:
+            for category, keywords in self.keywords.items():
+                self._category_patterns[category] = [
+                    (re.compile(r'\b' + re.escape(k.lower()) + r'\b'), k.lower())
+                    for k in keywords
+                ]
+
+    def _build_ac_automaton(self):
+        """Build an Aho-Corasick automaton over every keyword"""
+        cache_file = _PATTERN_CACHE_DIR / f"keyword_db_{self._keywords_digest()}.pkl"
+        if cache_file.exists():
+            try:
+                self._ac_automaton = pickle.loads(cache_file.read_bytes())
+                return
+            except Exception:
+                pass  # stale/corrupt cache; rebuild below
+
+        automaton = ahocorasick.Automaton()
+        count = 0
         for category, keywords in self.keywords.items():
-            self.patterns[category] = []
             for keyword in keywords:
-                # Create case-insensitive pattern with word boundaries
-                pattern = re.compile(r'\b' + re.escape(keyword) + r'\b', re.IGNORECASE)
-                self.patterns[category].append((keyword, pattern))
+                automaton.add_word(keyword.lower(), (category, keyword.lower()))
+                count += 1
+        if count:
+            automaton.make_automaton()
+            self._ac_automaton = automaton
+            try:
+                _PATTERN_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                cache_file.write_bytes(pickle.dumps(automaton))
+            except Exception:
+                pass  # cache write is best-effort
+
+    def _keywords_digest(self) -> str:
+        """Stable hash of the keyword lists, for pattern cache keys"""
+        payload = json.dumps(self.keywords, sort_keys=True).encode()
+        return hashlib.sha256(payload).hexdigest()[:16]
+
+    def _build_hyperscan_db(self):
+        """Compile every keyword into one Hyperscan database"""
+        self._hs_table = [
+            (category, keyword)
+            for category, keywords in self.keywords.items()
+            for keyword in keywords
+        ]
+        if not self._hs_table:
+            return
+
+        cache_file = _PATTERN_CACHE_DIR / f"keyword_db_{self._keywords_digest()}.hs"
+        if cache_file.exists():
+            try:
+                self._hs_db = hyperscan.loadb(cache_file.read_bytes())
+                return
+            except Exception:
+                pass  # stale/corrupt cache; recompile below
+
+        try:
+            db = hyperscan.Database()
+            db.compile(
+                expressions=[
+                    rb'\b' + re.escape(keyword).encode() + rb'\b'
+                    for _, keyword in self._hs_table
+                ],
+                ids=list(range(len(self._hs_table))),
+                # SINGLEMATCH: each keyword reported at most once per
+                # scan, matching the deduped regex semantics
+                flags=[
+                    hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH
+                ] * len(self._hs_table),
+            )
+            self._hs_db = db
+            try:
+                _PATTERN_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                cache_file.write_bytes(hyperscan.dumpb(db))
+            except Exception:
+                pass  # cache write is best-effort
+        except Exception as e:
+            print(f"Warning: Hyperscan compile failed, using regex: {e}")
+            self._hs_db = None
+
+    def _match_all(self, text: str) -> Dict[str, set]:
+        """Distinct lowercase keyword matches for every category.
+
+        Expects text already lowercased by the caller.
+        """
+        if self._hs_db is not None:
+            hits = set()
+            self._hs_db.scan(
+                text.encode(),
+                match_event_handler=lambda pid, start, end, flags, ctx: hits.add(pid)
+            )
+            matches = {category: set() for category in self.keywords}
+            for pid in hits:
+                category, keyword = self._hs_table[pid]
+                matches[category].add(keyword.lower())
+            return matches
+
+        if self._ac_automaton is not None:
+            matches = {category: set() for category in self.keywords}
+            for end, (category, keyword) in self._ac_automaton.iter(text):
+                start = end - len(keyword) + 1
+                if _boundary_ok(text, start, end):
+                    matches[category].add(keyword)
+            return matches
+
+        return {
+            category: self._category_matches(category, text)
+            for category in self.category_regex
+        }
+
+    def _category_matches(self, category: str, text: str) -> set:
+        """Distinct lowercase keyword matches for one category"""
+        regex = self.category_regex[category]
+        if regex is None or regex.search(text) is None:
+            return set()
+        # Something matched: per-keyword searches recover overlapping
+        # matches the consuming alternation scan would swallow, keeping
+        # this path score-identical to the AC/Hyperscan backends
+        return {
+            keyword
+            for pattern, keyword in self._category_patterns[category]
+            if pattern.search(text)
+        }
     
     def score_paper(self, paper) -> Tuple[float, List[str]]:
         """
@@ -106,27 +318,65 @@ class RelevanceScorer:
         Returns:
             Tuple of (score, matched_keywords)
         """
-        # Combine title and abstract for matching
-        text = f"{paper.title} {paper.abstract}"
-        
+        # Combine title and abstract for matching, lowered once; one
+        # pass over the text, deduped so a keyword scores once however
+        # often it appears
+        text = f"{paper.title} {paper.abstract}".lower()
+        return self._aggregate(self._match_all(text))
+
+    def _aggregate(self, matches_by_category: Dict[str, set]) -> Tuple[float, List[str]]:
+        """Turn per-category match sets into (score, matched_keywords)"""
         score = 0.0
         matched_keywords = []
-        
-        # Check each category
-        for category, patterns in self.patterns.items():
-            for keyword, pattern in patterns:
-                if pattern.search(text):
-                    weight = self.weights[category]
-                    score += weight
-                    
-                    if weight > 0:  # Don't include excluded keywords in matches
-                        matched_keywords.append(keyword)
-        
+
+        for category, matches in matches_by_category.items():
+            if not matches:
+                continue
+
+            weight = self.weights[category]
+            score += weight * len(matches)
+
+            if weight > 0:  # Don't include excluded keywords in matches
+                matched_keywords.extend(
+                    self._original_case[match] for match in matches
+                )
+
         # Normalize score (0-100 scale)
         # Max realistic score ~15 keywords * 3 weight = 45
         normalized_score = min(100, max(0, (score / 45) * 100))
-        
+
         return normalized_score, matched_keywords
+
+    def _score_corpus(self, papers: list) -> List[Tuple[float, List[str]]]:
+        """Score every paper with one automaton pass over a joined buffer.
+
+        Concatenates all titles+abstracts around a NUL sentinel (a
+        non-word character no keyword contains, so matches cannot span
+        papers) and attributes each hit back to its paper by bisecting
+        the paper end offsets. One C-level scan replaces a per-paper
+        Python loop re-entering the matcher.
+        """
+        sentinel = '\n\x00\n'
+        texts = [f"{p.title} {p.abstract}".lower() for p in papers]
+        big = sentinel.join(texts)
+
+        # boundaries[i] = end offset (exclusive) of paper i's text
+        boundaries = []
+        pos = 0
+        for text in texts:
+            pos += len(text)
+            boundaries.append(pos)
+            pos += len(sentinel)
+
+        per_paper = [{category: set() for category in self.keywords}
+                     for _ in papers]
+
+        for end, (category, keyword) in self._ac_automaton.iter(big):
+            start = end - len(keyword) + 1
+            if _boundary_ok(big, start, end):
+                per_paper[bisect_right(boundaries, start)][category].add(keyword)
+
+        return [self._aggregate(matches) for matches in per_paper]
     
     def filter_and_score_papers(self, papers: list, min_score: float = 5.0) -> list:
         """
@@ -140,12 +390,17 @@ class RelevanceScorer:
             List of papers with relevance scores, sorted by score
         """
         print(f"  Scoring {len(papers)} papers for relevance...")
-        
+
+        # The Aho-Corasick backend can scan the whole corpus in one pass
+        # (Hyperscan's SINGLEMATCH dedup is per scan, so it stays per-paper)
+        if self._ac_automaton is not None and self._hs_db is None and len(papers) > 1:
+            results = self._score_corpus(papers)
+        else:
+            results = [self.score_paper(paper) for paper in papers]
+
         scored_papers = []
-        
-        for paper in papers:
-            score, keywords = self.score_paper(paper)
-            
+
+        for paper, (score, keywords) in zip(papers, results):
             if score >= min_score:
                 paper.relevance_score = score
                 paper.matched_keywords = keywords  # Add as attribute
@@ -160,7 +415,7 @@ class RelevanceScorer:
     
     def get_score_breakdown(self, paper) -> Dict:
         """Get detailed breakdown of why a paper scored as it did"""
-        text = f"{paper.title} {paper.abstract}"
+        text = f"{paper.title} {paper.abstract}".lower()
         
         breakdown = {
             'primary_matches': [],
@@ -169,11 +424,11 @@ class RelevanceScorer:
             'exclude_matches': []
         }
         
-        for category, patterns in self.patterns.items():
-            for keyword, pattern in patterns:
-                if pattern.search(text):
-                    breakdown[f'{category}_matches'].append(keyword)
-        
+        for category, matches in self._match_all(text).items():
+            breakdown[f'{category}_matches'].extend(
+                self._original_case[match] for match in matches
+            )
+
         return breakdown
 
 
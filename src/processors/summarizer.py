@@ -3,32 +3,95 @@ Paper Summarizer using Claude API
 
 Generates concise summaries of academic papers tailored to Leopold's interests.
 """
+import asyncio
+import hashlib
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
 from typing import List, Optional
 import json
 
+# Summaries are content-addressed (hash of source, ID and abstract
+# prefix), so entries never go stale and need no TTL; persisting them
+# skips re-summarizing the papers that overlap between daily runs
+_SUMMARY_CACHE_PATH = Path(__file__).parent.parent.parent / "data" / "summary_cache.json"
+
 
 class PaperSummarizer:
     """Summarizes papers using Claude API"""
-    
+
+    MODEL = "claude-sonnet-4-20250514"
+
+    # Concurrent in-flight API calls for batch summarization
+    MAX_CONCURRENCY = 8
+
+    # Papers bundled into one API request: amortizes per-request
+    # time-to-first-token and shared prompt tokens across the group
+    GROUP_SIZE = 8
+
     def __init__(self, api_key: str = None):
         """
         Initialize summarizer
-        
+
         Args:
             api_key: Anthropic API key (defaults to ANTHROPIC_API_KEY env var)
         """
         self.api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
         self.client = None
-        
+        self.async_client = None
+        self._summary_cache = self._load_summary_cache()
+
         if self.api_key:
             try:
-                from anthropic import Anthropic
+                from anthropic import Anthropic, AsyncAnthropic
                 self.client = Anthropic(api_key=self.api_key)
+                self.async_client = AsyncAnthropic(api_key=self.api_key)
             except ImportError:
                 print("Warning: anthropic package not installed. Summaries disabled.")
         else:
             print("Warning: No ANTHROPIC_API_KEY found. Summaries disabled.")
+
+    @staticmethod
+    def _summary_key(paper) -> str:
+        """Content-addressed cache key for a paper's summary"""
+        payload = (
+            f"{getattr(paper, 'source', '')}"
+            f"{getattr(paper, 'source_id', '')}"
+            f"{paper.abstract[:500]}"
+        )
+        return hashlib.sha1(payload.encode()).hexdigest()
+
+    @staticmethod
+    def _load_summary_cache() -> dict:
+        """Load previously generated summaries from disk"""
+        try:
+            return json.loads(_SUMMARY_CACHE_PATH.read_text())
+        except (OSError, ValueError):
+            return {}
+
+    def _save_summary_cache(self):
+        """Write the summary cache back to disk"""
+        try:
+            _SUMMARY_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            _SUMMARY_CACHE_PATH.write_text(json.dumps(self._summary_cache))
+        except OSError as e:
+            print(f"  Could not save summary cache: {e}")
+
+    def _build_prompt(self, paper) -> str:
+        """Build the summarization prompt for a paper"""
+        return f"""You are helping a researcher in energy economics and market design.
+Summarize this academic paper in 2-3 sentences. Focus on:
+- The main research question
+- The methodology (theory/empirical/experiment)
+- The key finding or contribution
+
+Be concise and technical. The reader is an expert.
+
+Title: {paper.title}
+
+Abstract: {paper.abstract[:1500]}
+
+Summary:"""
     
     def summarize_paper(self, paper, max_length: int = 150) -> str:
         """
@@ -43,45 +106,161 @@ class PaperSummarizer:
         """
         if not self.client:
             return self._simple_summary(paper)
-        
-        try:
-            prompt = f"""You are helping a researcher in energy economics and market design. 
-Summarize this academic paper in 2-3 sentences. Focus on:
-- The main research question
-- The methodology (theory/empirical/experiment)
-- The key finding or contribution
-
-Be concise and technical. The reader is an expert.
 
-Title: {paper.title}
+        cache_key = self._summary_key(paper)
+        cached = self._summary_cache.get(cache_key)
+        if cached:
+            return cached
 
-Abstract: {paper.abstract[:1500]}
+        try:
+            # Stream the response and stop once the 2-3 sentence target
+            # is reached: leaving the context manager aborts generation,
+            # cutting tail latency instead of waiting out max_tokens.
+            # Boundaries are '. ' (as in _simple_summary), not raw
+            # periods, which decimals and abbreviations would inflate
+            chunks = []
+            boundaries = 0
+            cut_early = False
+            with self.client.messages.stream(
+                model=self.MODEL,
+                max_tokens=200,
+                messages=[{"role": "user", "content": self._build_prompt(paper)}]
+            ) as stream:
+                for text in stream.text_stream:
+                    chunks.append(text)
+                    boundaries += text.count('. ')
+                    if boundaries >= 3:
+                        cut_early = True
+                        break
 
-Summary:"""
+            summary = ''.join(chunks).strip()
+            trimmed = False
+            if cut_early and not summary.endswith('.'):
+                # Drop the partial sentence after the last boundary
+                end = summary.rfind('. ')
+                if end != -1:
+                    summary = summary[:end + 1]
+                trimmed = True
+            if summary and not trimmed:
+                # Trimmed output stays out of the persistent cache ('. '
+                # can be a false boundary, e.g. after "U.S."), so a
+                # mangled summary can never outlive the run that made it
+                self._summary_cache[cache_key] = summary
+            return summary
 
-            response = self.client.messages.create(
-                model="claude-sonnet-4-20250514",
-                max_tokens=200,
-                messages=[{"role": "user", "content": prompt}]
-            )
-            
-            return response.content[0].text.strip()
-            
         except Exception as e:
             print(f"    Error summarizing paper: {e}")
             return self._simple_summary(paper)
+
+    async def _summarize_one_async(self, paper, sem: asyncio.Semaphore) -> str:
+        """Summarize a single paper under a concurrency limit"""
+        async with sem:
+            try:
+                response = await self.async_client.messages.create(
+                    model=self.MODEL,
+                    max_tokens=200,
+                    messages=[{"role": "user", "content": self._build_prompt(paper)}]
+                )
+                return response.content[0].text.strip()
+            except Exception as e:
+                print(f"    Error summarizing paper: {e}")
+                return self._simple_summary(paper)
+
+    def _build_group_prompt(self, papers: list) -> str:
+        """Build a single prompt summarizing several papers as JSON"""
+        entries = [
+            {"i": i, "title": paper.title, "abstract": paper.abstract[:1500]}
+            for i, paper in enumerate(papers)
+        ]
+        return f"""You are helping a researcher in energy economics and market design.
+For each paper below, write a 2-3 sentence summary covering the main
+research question, the methodology (theory/empirical/experiment), and the
+key finding or contribution. Be concise and technical. The reader is an expert.
+
+Papers (JSON):
+{json.dumps(entries)}
+
+Respond with ONLY a JSON array of the form
+[{{"i": 0, "summary": "..."}}, ...] with one entry per paper and no other text."""
+
+    @staticmethod
+    def _parse_group_response(text: str, count: int) -> Optional[List[str]]:
+        """Parse a grouped-summary JSON reply; None if it doesn't line up"""
+        text = text.strip()
+        if text.startswith("```"):
+            # Strip a markdown code fence if the model added one
+            text = text.strip("`").lstrip("json").strip()
+
+        try:
+            summaries = [None] * count
+            for item in json.loads(text):
+                summaries[item["i"]] = str(item["summary"]).strip()
+            if any(summary is None for summary in summaries):
+                return None
+            return summaries
+        except Exception:
+            return None
+
+    async def _summarize_group_async(self, group: list,
+                                     sem: asyncio.Semaphore) -> List[str]:
+        """Summarize a group of papers in one API call.
+
+        Falls back to per-paper calls when the request fails or the
+        JSON reply can't be matched back to the papers.
+        """
+        async with sem:
+            text = None
+            try:
+                response = await self.async_client.messages.create(
+                    model=self.MODEL,
+                    max_tokens=200 * len(group),
+                    messages=[{"role": "user",
+                               "content": self._build_group_prompt(group)}]
+                )
+                text = response.content[0].text
+            except Exception as e:
+                print(f"    Error summarizing paper group: {e}")
+
+        if text:
+            summaries = self._parse_group_response(text, len(group))
+            if summaries:
+                return summaries
+
+        return list(await asyncio.gather(
+            *(self._summarize_one_async(paper, sem) for paper in group)
+        ))
+
+    async def _summarize_batch_async(self, papers: list) -> List[str]:
+        """Summarize papers in concurrent grouped API calls"""
+        sem = asyncio.Semaphore(self.MAX_CONCURRENCY)
+        groups = [
+            papers[i:i + self.GROUP_SIZE]
+            for i in range(0, len(papers), self.GROUP_SIZE)
+        ]
+        results = await asyncio.gather(
+            *(self._summarize_group_async(group, sem) for group in groups)
+        )
+        return [summary for group in results for summary in group]
     
     def _simple_summary(self, paper) -> str:
         """Generate a simple summary without AI (first 2 sentences of abstract)"""
-        if not paper.abstract:
+        abstract = paper.abstract or ""
+        if not abstract:
             return "No abstract available."
-        
-        sentences = paper.abstract.split('. ')
-        summary = '. '.join(sentences[:2])
-        
+
+        # Find the second sentence boundary directly instead of
+        # splitting the whole abstract into a list just to keep two
+        first = abstract.find('. ')
+        second = abstract.find('. ', first + 2) if first != -1 else -1
+
+        if second != -1:
+            summary = abstract[:second]
+        else:
+            summary = abstract.rstrip('.')
+
         if len(summary) > 300:
             summary = summary[:297] + "..."
-            
+
         return summary + "."
     
     def summarize_papers_batch(self, papers: list, max_papers: int = 15) -> list:
@@ -95,15 +274,51 @@ Summary:"""
         Returns:
             Papers with summary field populated
         """
-        print(f"  Generating summaries for {min(len(papers), max_papers)} papers...")
-        
-        for i, paper in enumerate(papers[:max_papers]):
-            paper.summary = self.summarize_paper(paper)
-            
-            # Progress indicator
-            if (i + 1) % 5 == 0:
-                print(f"    Summarized {i + 1}/{min(len(papers), max_papers)}")
-        
+        batch = papers[:max_papers]
+        print(f"  Generating summaries for {len(batch)} papers...")
+
+        if self.async_client:
+            # Resolve cached summaries up front; only the rest go to the API
+            pending = []
+            for paper in batch:
+                cached = self._summary_cache.get(self._summary_key(paper))
+                if cached:
+                    paper.summary = cached
+                else:
+                    pending.append(paper)
+
+            if pending:
+                # Run the API calls concurrently; wall time is roughly the
+                # latency of one call rather than the sum of all of them
+                summaries = asyncio.run(self._summarize_batch_async(pending))
+                for paper, summary in zip(pending, summaries):
+                    paper.summary = summary
+                    # Don't cache extractive fallbacks from failed calls
+                    if summary and summary != self._simple_summary(paper):
+                        self._summary_cache[self._summary_key(paper)] = summary
+        elif self.client:
+            # Sync-client fallback: the Anthropic client is thread-safe
+            # and the GIL is released during HTTP I/O, so a small pool
+            # still overlaps the per-call network latency
+            with ThreadPoolExecutor(max_workers=5) as executor:
+                futures = {
+                    executor.submit(self.summarize_paper, paper): paper
+                    for paper in batch
+                }
+                for i, future in enumerate(as_completed(futures)):
+                    futures[future].summary = future.result()
+
+                    # Progress indicator
+                    if (i + 1) % 5 == 0:
+                        print(f"    Summarized {i + 1}/{len(batch)}")
+        else:
+            # No API client: cheap extractive summaries, no parallelism needed
+            for paper in batch:
+                paper.summary = self._simple_summary(paper)
+
+        if self.client or self.async_client:
+            self._save_summary_cache()
+
         return papers
     
     def generate_digest_intro(self, papers: list, period: str = "daily") -> str:
@@ -143,7 +358,7 @@ Write a brief 2-3 sentence overview highlighting:
 Keep it professional and concise."""
 
             response = self.client.messages.create(
-                model="claude-sonnet-4-20250514",
+                model=self.MODEL,
                 max_tokens=150,
                 messages=[{"role": "user", "content": prompt}]
             )